@@ -2,17 +2,25 @@
 Main file for the Barangay API.
 """
 
+import hashlib
 import time
 import os
-from typing import Any, Dict, List, Literal
+from collections import defaultdict
+from functools import lru_cache
+from importlib.metadata import version as package_version
+from typing import Any, Dict, FrozenSet, List, Literal, Tuple
 
-from barangay import BARANGAY, BARANGAY_FLAT, search
+import orjson
+from barangay import BARANGAY, BARANGAY_FLAT, create_fuzz_base, search
 from dotenv import load_dotenv
-from fastapi import APIRouter, FastAPI, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from scalar_fastapi import Layout, Theme, get_scalar_api_reference
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Loading dotenv
 load_dotenv()
@@ -24,7 +32,7 @@ A simple API for searching and retrieving information about barangays in the
 Philippines.
 
 - **Source code**: [Barangay-API GitHub](https://github.com/bendlikeabamboo/barangay-api)
-- **Docker image**: [Barangay-API v2026.1.13.0](https://hub.docker.com/r/bendlikeabamboo/barangay-api)
+- **Docker image**: [Barangay-API v2026.1.13.1](https://hub.docker.com/r/bendlikeabamboo/barangay-api)
 - **Philippines Standard Geographic Code PSGC Reference:** [January 13, 2026 Release](https://psa.gov.ph/classification/psgc/node/1684082306)
 - **Barangay Package PyPI:** [![PyPI version](https://badge.fury.io/py/barangay.svg)](https://badge.fury.io/py/barangay)
 - **Barangay Package Source Code:** [Barangay GitHub](https://github.com/bendlikeabamboo/barangay)
@@ -35,27 +43,25 @@ Try it out in live in the official deployment:
 - [Barangay-API (SwaggerUI)](https://barangay-api.hawitsu.xyz/docs)
 - [Barangay-API (Redoc)](https://barangay-api.hawitsu.xyz/redoc)
 """
-desc = (
-    (desc_none)
-    + (
-        desc_standard
-        if str(os.getenv("DESC_STANDARD", True)).lower() in ("true", "t", "1")
-        else ""
-    )
-    + (
-        desc_official_deployment
-        if str(os.getenv("DESC_OFFICIAL_DEPLOYMENT", False)).lower()
-        in ("true", "t", "1")
-        else ""
-    )
-)
+
+
+def _truthy(value: str | None) -> bool:
+    return str(value).lower() in ("true", "t", "1")
+
+
+desc = desc_none
+if _truthy(os.getenv("DESC_STANDARD", "true")):
+    desc += desc_standard
+if _truthy(os.getenv("DESC_OFFICIAL_DEPLOYMENT", "false")):
+    desc += desc_official_deployment
 
 # Initializing application
 app = FastAPI(
     title="Barangay API",
     description=desc,
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
-    version="2026.1.13.0",
+    version="2026.1.13.1",
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {
             "name": "Search",
@@ -79,6 +85,41 @@ app = FastAPI(
         },
     ],
 )
+
+
+# Adding middlewares
+class ElapsedSecondsMiddleware:
+    """
+    Pure ASGI middleware that reports the time taken until the response starts in an
+    `X-Elapsed-Seconds` header. Cacheable responses (those with an `ETag`) are left
+    alone so a cached copy never replays a stale timing.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        t0 = time.perf_counter()
+
+        async def send_with_elapsed_seconds(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if "etag" not in headers:
+                    headers["X-Elapsed-Seconds"] = f"{time.perf_counter() - t0:.6f}"
+            await send(message)
+
+        await self.app(scope, receive, send_with_elapsed_seconds)
+
+
+_GZIP_MINIMUM_SIZE = 1000
+app.add_middleware(GZipMiddleware, minimum_size=_GZIP_MINIMUM_SIZE, compresslevel=5)
+app.add_middleware(ElapsedSecondsMiddleware)
+
+
 # Adding mounts
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -89,16 +130,26 @@ psgc_router = APIRouter(tags=["Philippine Standard Geographic Code (PSGC)"])
 
 
 # Defining RequestForms (for data validation)
+MatchHook = Literal["province", "municipality", "barangay"]
+_REQUIRED_MATCH_HOOK: MatchHook = "barangay"
+# Bounds on the client-controlled parts of the search cache key. A full
+# `_cached_search` cache holds at most 4096 x 100 trimmed results (under ~100 MB).
+_MAX_SEARCH_STRING_LENGTH = 256
+_MAX_LEN_RESULTS = 100
+
+
 class SearchBarangayRequest(BaseModel):
-    search_string: str
-    match_hooks: List[Literal["province", "municipality", "barangay"]] | None = Field(
+    search_string: str = Field(max_length=_MAX_SEARCH_STRING_LENGTH)
+    match_hooks: List[MatchHook] | None = Field(
         default=["barangay", "municipality", "province"]
     )
     threshold: float | None = 60
-    len_results: int | None = 1
+    len_results: int | None = Field(default=1, ge=1, le=_MAX_LEN_RESULTS)
 
 
 class Barangay(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     barangay: str
     province_or_huc: str | None = None
     municipality_or_city: str | None = None
@@ -106,45 +157,156 @@ class Barangay(BaseModel):
 
 
 class SearchBarangayResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     results: List[Barangay]
-    elapsed_seconds: float
 
 
 # Helper functions
+_BARANGAY_FIELDS = tuple(Barangay.model_fields)
+# Sanitized names and scorer partials for the fuzzy matcher, built once at startup so
+# `search` never has to rebuild them per request.
+_FUZZ_BASE = create_fuzz_base()
 administrative_area_by_id = {area["psgc_id"]: area for area in BARANGAY_FLAT}
-
-
-def _check_region(region: str):
-    if region not in list(BARANGAY.keys()):
+administrative_area_by_name: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+for _area in BARANGAY_FLAT:
+    administrative_area_by_name[_area["name"]].append(_area)
+
+# Precomputed responses. `BARANGAY` is static, so every forms endpoint is serialized
+# once at import, keyed by the path of the level whose children it lists. An HUC
+# without municipalities is keyed as its own municipality or city.
+_FORMS_CACHE: Dict[Tuple[str, ...], bytes] = {(): orjson.dumps(list(BARANGAY.keys()))}
+for _region, _provinces in BARANGAY.items():
+    _FORMS_CACHE[(_region,)] = orjson.dumps(list(_provinces.keys()))
+    for _prov, _munis in _provinces.items():
+        if isinstance(_munis, list):
+            _munis = {_prov: _munis}
+        _FORMS_CACHE[(_region, _prov)] = orjson.dumps(list(_munis.keys()))
+        for _muni, _barangays in _munis.items():
+            _FORMS_CACHE[(_region, _prov, _muni)] = orjson.dumps(_barangays)
+
+# The responses only change between deploys, so one ETag covers every static response.
+# By default (`CACHE_MAX_AGE=0`) caches must revalidate on every use, so a deploy is
+# seen immediately at the cost of a 304 round trip. A positive `CACHE_MAX_AGE` lets
+# shared caches (CDNs, reverse proxies) serve stale responses for up to that many
+# seconds after a deploy without revalidating.
+# The digest covers the serialized forms responses, the `barangay` data release (which
+# backs `/id` and `/name`) and the API version (which covers payload shape changes).
+# `GZipMiddleware` may compress the body without touching the ETag, so the validator
+# is weak and every static response (including 304s) varies on `Accept-Encoding`. The
+# middleware already adds that `Vary` to bodies of `_GZIP_MINIMUM_SIZE` or more.
+_digest = hashlib.sha1(usedforsecurity=False)
+_digest.update(f"{app.version}:{package_version('barangay')}".encode())
+for _path, _content in _FORMS_CACHE.items():
+    _digest.update(orjson.dumps(_path))
+    _digest.update(_content)
+_ETAG = f'W/"{_digest.hexdigest()}"'
+_CACHE_MAX_AGE = int(os.getenv("CACHE_MAX_AGE", "0"))
+_STATIC_HEADERS = {
+    "ETag": _ETAG,
+    "Vary": "Accept-Encoding",
+    "Cache-Control": (
+        f"public, max-age={_CACHE_MAX_AGE}"
+        if _CACHE_MAX_AGE > 0
+        else "public, no-cache"
+    ),
+}
+_GZIPPED_STATIC_HEADERS = {k: v for k, v in _STATIC_HEADERS.items() if k != "Vary"}
+
+# Serialized lazily, on the first request for each PSGC ID or known name.
+_id_json_cache: Dict[str, bytes] = {}
+_name_json_cache: Dict[str, bytes] = {}
+_EMPTY_JSON_LIST = orjson.dumps([])
+
+
+def _resolve(
+    region: str,
+    province_or_highly_urbanized_city: str | None = None,
+    municipality_or_city: str | None = None,
+) -> Tuple[str, ...]:
+    """
+    Walk `BARANGAY` down the given path once, raising a 404 at the first level that
+    does not exist. Returns the validated path; an HUC without municipalities stands
+    in as its own municipality or city.
+    """
+    provinces = BARANGAY.get(region)
+    if provinces is None:
         raise HTTPException(
             status_code=404, detail=f"No such region: '{region}'." "Try `/regions`?"
         )
+    if province_or_highly_urbanized_city is None:
+        return (region,)
 
-
-def _check_province_or_highly_urbanized_city(
-    region: str, province_or_highly_urbanized_city: str
-):
-    if province_or_highly_urbanized_city not in list(BARANGAY[region].keys()):
+    municipalities = provinces.get(province_or_highly_urbanized_city)
+    if municipalities is None:
         raise HTTPException(
             status_code=404,
             detail=f"No such province or highly urbanized city: "
             f"'{province_or_highly_urbanized_city}'. "
             "Try `/{region}/province_or_highly_urbanized_city?",
         )
+    if municipality_or_city is None:
+        return (region, province_or_highly_urbanized_city)
 
-
-def _check_municipality_or_city(
-    region: str, province_or_highly_urbanized_city: str, municipality_or_city: str
-):
-    if municipality_or_city not in list(
-        BARANGAY[region][province_or_highly_urbanized_city].keys()
-    ) and municipality_or_city not in list(BARANGAY[region].keys()):
+    if isinstance(municipalities, list):
+        municipality_or_city = province_or_highly_urbanized_city
+    elif municipality_or_city not in municipalities:
         raise HTTPException(
             status_code=404,
             detail=f"No such municipality or city: "
             f"'{municipality_or_city}'. "
             "Try `'/{region}/{province_or_highly_urbanized_city}/municipality_or_city'",
         )
+    return (region, province_or_highly_urbanized_city, municipality_or_city)
+
+
+def _static_response(request: Request, content: bytes) -> Response:
+    """
+    Serve precomputed JSON `content`, or reply `304 Not Modified` when the client
+    already holds the current data. Only call this once the resource is known to exist.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison: `W/` is ignored on both sides.
+        etags = {e.strip().removeprefix("W/") for e in if_none_match.split(",")}
+        if "*" in etags or _ETAG.removeprefix("W/") in etags:
+            return Response(status_code=304, headers=_STATIC_HEADERS)
+    headers = (
+        _STATIC_HEADERS
+        if len(content) < _GZIP_MINIMUM_SIZE
+        else _GZIPPED_STATIC_HEADERS
+    )
+    return Response(content, media_type="application/json", headers=headers)
+
+
+def _forms_response(request: Request, *path: str) -> Response:
+    """
+    Serve the precomputed listing for `path`. Misses fall back to `_resolve`, which
+    raises the appropriate 404 or maps an HUC onto itself.
+    """
+    content = _FORMS_CACHE.get(path)
+    if content is None:
+        content = _FORMS_CACHE[_resolve(*path)]
+    return _static_response(request, content)
+
+
+@lru_cache(maxsize=4096)
+def _cached_search(
+    search_string: str, match_hooks: FrozenSet[MatchHook], threshold: float, n: int
+) -> Tuple[Dict[str, Any], ...]:
+    # Repeated searches (e.g. typeahead) skip the fuzzy matcher entirely. The cached
+    # results are shared across requests, so callers must not mutate them. Results
+    # are trimmed to the `Barangay` fields, dropping the matcher's scoring columns.
+    results = search(
+        search_string=search_string,
+        match_hooks=list(match_hooks),
+        threshold=threshold,
+        n=n,
+        fuzz_base=_FUZZ_BASE,
+    )
+    return tuple(
+        {field: result[field] for field in _BARANGAY_FIELDS} for result in results
+    )
 
 
 def _check_id(id: str):
@@ -173,125 +335,115 @@ async def root() -> RedirectResponse:
     return RedirectResponse(url="/scalar/")
 
 
-@search_router.post("/search_barangay")
+@search_router.post("/search_barangay", response_model=SearchBarangayResult)
 async def search_barangay(
     search_request: SearchBarangayRequest,
-) -> SearchBarangayResult:
+) -> Response:
     """
     Search for a barangay. Uses [barangay](https://pypi.org/project/barangay) Python
     package.
     """
-    t0 = time.time()
-    match_hooks = search_request.match_hooks or ["barangay", "municipality"]
+    # A frozenset is hashable for the search cache and ignores order and duplicates.
+    match_hooks = frozenset(search_request.match_hooks or ["barangay", "municipality"])
     threshold = search_request.threshold or 60
     n = search_request.len_results or 1
 
-    if "barangay" not in match_hooks:
+    if _REQUIRED_MATCH_HOOK not in match_hooks:
         raise HTTPException(
             status_code=400,
             detail="Malformed request: `match_hooks` needs at least 'barangay'. "
             "For example ['barangay', 'municipality']",
         )
 
-    results = search(
+    results = _cached_search(
         search_string=search_request.search_string,
         match_hooks=match_hooks,
         threshold=threshold,
         n=n,
     )
-    validated_results: List[Barangay] = []
-    for result in results:
-        validated_results.append(Barangay.model_validate(result))
-    return SearchBarangayResult(
-        results=validated_results, elapsed_seconds=time.time() - t0
-    )
+    return ORJSONResponse(content={"results": results})
 
 
-@forms_router.get("/regions")
-async def get_regions() -> List[str]:
+@forms_router.get("/regions", response_model=List[str])
+async def get_regions(request: Request) -> Response:
     """
     Return a list of all regions in the Philippines.
     """
-    return list(BARANGAY.keys())
+    return _static_response(request, _FORMS_CACHE[()])
 
 
-@forms_router.get("/{region}/provinces_and_highly_urbanized_cities")
-async def get_provinces_and_highly_urbanized_cities(region: str) -> List[str]:
+@forms_router.get(
+    "/{region}/provinces_and_highly_urbanized_cities", response_model=List[str]
+)
+async def get_provinces_and_highly_urbanized_cities(
+    request: Request, region: str
+) -> Response:
     """
     Return a list of all provinces and highly urbanized cities (HUCs) in the Philippines
     given a region. **Note**: in some unusual cases, this may also return a municipality
     (e.g. Pateros in the National Capital Region).
     """
-    _check_region(region=region)
-    return list(BARANGAY[region].keys())
+    return _forms_response(request, region)
 
 
 @forms_router.get(
-    "/{region}/{province_or_highly_urbanized_city}/municipalities_and_cities"
+    "/{region}/{province_or_highly_urbanized_city}/municipalities_and_cities",
+    response_model=List[str],
 )
 async def get_municipalities_and_cities(
-    region: str, province_or_highly_urbanized_city: str
-) -> List[str]:
+    request: Request, region: str, province_or_highly_urbanized_city: str
+) -> Response:
     """
     Return a list of all municipalities and cities given a region and a province or
     highly urbanized city (HUC) in the Philippines. **Note**: If an HUC is provided,
     this will simply return the HUC back which you can use as a valid municipality or
     city.
     """
-    _check_region(region=region)
-    _check_province_or_highly_urbanized_city(
-        region=region,
-        province_or_highly_urbanized_city=province_or_highly_urbanized_city,
-    )
-    if isinstance(BARANGAY[region][province_or_highly_urbanized_city], dict):
-        return list(BARANGAY[region][province_or_highly_urbanized_city].keys())
-    return [province_or_highly_urbanized_city]
+    return _forms_response(request, region, province_or_highly_urbanized_city)
 
 
 @forms_router.get(
-    "/{region}/{province_or_highly_urbanized_city}/{municipality_or_city}/barangays"
+    "/{region}/{province_or_highly_urbanized_city}/{municipality_or_city}/barangays",
+    response_model=List[str],
 )
 async def get_barangays(
-    region: str, province_or_highly_urbanized_city: str, municipality_or_city: str
-) -> List[str]:
-    _check_region(region=region)
-
-    _check_province_or_highly_urbanized_city(
-        region=region,
-        province_or_highly_urbanized_city=province_or_highly_urbanized_city,
-    )
-
-    if isinstance(BARANGAY[region][province_or_highly_urbanized_city], list):
-        return list(BARANGAY[region][province_or_highly_urbanized_city])
-
-    _check_municipality_or_city(
-        region=region,
-        province_or_highly_urbanized_city=province_or_highly_urbanized_city,
-        municipality_or_city=municipality_or_city,
+    request: Request,
+    region: str,
+    province_or_highly_urbanized_city: str,
+    municipality_or_city: str,
+) -> Response:
+    return _forms_response(
+        request, region, province_or_highly_urbanized_city, municipality_or_city
     )
-    return BARANGAY[region][province_or_highly_urbanized_city][municipality_or_city]
 
 
-@psgc_router.get("/id/{id}")
-async def get_administrative_area_by_id(id: str):
+@psgc_router.get("/id/{id}", response_model=Dict[str, Any])
+async def get_administrative_area_by_id(request: Request, id: str) -> Response:
     """
     Get administrative area using PSGC ID
     """
-    _check_id(id)
-    return administrative_area_by_id[id]
+    content = _id_json_cache.get(id)
+    if content is None:
+        _check_id(id)
+        content = _id_json_cache[id] = orjson.dumps(administrative_area_by_id[id])
+    return _static_response(request, content)
 
 
-@psgc_router.get("/name/{name}")
-async def get_administrative_area_by_name(name: str) -> List[Dict[str, Any]]:
+@psgc_router.get("/name/{name}", response_model=List[Dict[str, Any]])
+async def get_administrative_area_by_name(request: Request, name: str) -> Response:
     """
     Get administrative area using official name from PSGC. Name could be region,
     province, highly urbanized city (HUCs), city, municipality, or barangay.
     """
-    res: List[Dict[str, Any]] = []
-    for i in BARANGAY_FLAT:
-        if i["name"] == name:
-            res.append(i)
-    return res
+    content = _name_json_cache.get(name)
+    if content is None:
+        if name in administrative_area_by_name:
+            content = _name_json_cache[name] = orjson.dumps(
+                administrative_area_by_name[name]
+            )
+        else:
+            content = _EMPTY_JSON_LIST
+    return _static_response(request, content)
 
 
 # Finally, mounting routers to application
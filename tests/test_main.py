@@ -0,0 +1,118 @@
+from urllib.parse import quote
+
+import pytest
+from barangay import BARANGAY
+from fastapi.testclient import TestClient
+
+from barangay_api.main import app
+
+REGION = "National Capital Region (NCR)"
+HUC = "City of Makati"
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    return TestClient(app)
+
+
+def _url(*parts: str) -> str:
+    return "/" + "/".join(quote(part) for part in parts)
+
+
+def test_static_response_has_validators(client: TestClient) -> None:
+    response = client.get("/regions")
+    assert response.status_code == 200
+    assert response.json() == list(BARANGAY)
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "public, no-cache"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "x-elapsed-seconds" not in response.headers
+
+
+@pytest.mark.parametrize("strip_weak", [False, True])
+def test_matching_etag_is_not_modified(client: TestClient, strip_weak: bool) -> None:
+    etag = client.get("/regions").headers["etag"]
+    if strip_weak:
+        etag = etag.removeprefix("W/")
+    response = client.get("/regions", headers={"If-None-Match": f'"other", {etag}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == client.get("/regions").headers["etag"]
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_wildcard_is_not_modified(client: TestClient) -> None:
+    response = client.get(_url("id", "1380300000"), headers={"If-None-Match": "*"})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_stale_etag_is_served(client: TestClient) -> None:
+    response = client.get("/regions", headers={"If-None-Match": 'W/"stale"'})
+    assert response.status_code == 200
+    assert response.json() == list(BARANGAY)
+
+
+def test_gzipped_response_varies_once(client: TestClient) -> None:
+    url = _url(REGION, "City of Caloocan", "City of Caloocan", "barangays")
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        _url("No Such Region", "provinces_and_highly_urbanized_cities"),
+        _url(REGION, "No Such City", "municipalities_and_cities"),
+        _url(REGION, "No Such City", HUC, "barangays"),
+        _url("Region IV-A (CALABARZON)", "Cavite", "No Such Town", "barangays"),
+        _url("id", "bad"),
+        _url("nope", "at", "all"),
+    ],
+)
+def test_unknown_resource_is_not_found(client: TestClient, url: str) -> None:
+    response = client.get(url, headers={"If-None-Match": "*"})
+    assert response.status_code == 404
+
+
+def test_huc_stands_in_as_its_own_city(client: TestClient) -> None:
+    municipalities = client.get(_url(REGION, HUC, "municipalities_and_cities"))
+    assert municipalities.status_code == 200
+    assert municipalities.json() == [HUC]
+
+    for municipality_or_city in (HUC, "anything"):
+        response = client.get(_url(REGION, HUC, municipality_or_city, "barangays"))
+        assert response.status_code == 200
+        assert response.json() == BARANGAY[REGION][HUC]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"search_string": "x" * 257},
+        {"search_string": "Makati", "len_results": 0},
+        {"search_string": "Makati", "len_results": 101},
+    ],
+)
+def test_search_bounds_are_rejected(client: TestClient, body: dict) -> None:
+    response = client.post("/search_barangay", json=body)
+    assert response.status_code == 422
+
+
+def test_search_returns_barangay_fields(client: TestClient) -> None:
+    response = client.post(
+        "/search_barangay", json={"search_string": "Tongmageng", "len_results": 3}
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert 1 <= len(results) <= 3
+    assert set(results[0]) == {
+        "barangay",
+        "province_or_huc",
+        "municipality_or_city",
+        "psgc_id",
+    }
+    assert "x-elapsed-seconds" in response.headers